@@ -11,98 +11,101 @@ export function initDatabase(): void {
   db.exec('PRAGMA journal_mode = WAL');
   db.exec('PRAGMA synchronous = NORMAL');
   
-  // Create events table
-  db.exec(`
-    CREATE TABLE IF NOT EXISTS events (
-      id INTEGER PRIMARY KEY AUTOINCREMENT,
-      source_app TEXT NOT NULL,
-      session_id TEXT NOT NULL,
-      hook_event_type TEXT NOT NULL,
-      payload TEXT NOT NULL,
-      chat TEXT,
-      summary TEXT,
-      timestamp INTEGER NOT NULL
-    )
-  `);
-  
-  // Check if chat column exists, add it if not (for migration)
-  try {
-    const columns = db.prepare("PRAGMA table_info(events)").all() as any[];
-    const hasChatColumn = columns.some((col: any) => col.name === 'chat');
-    if (!hasChatColumn) {
-      db.exec('ALTER TABLE events ADD COLUMN chat TEXT');
-    }
+  // Create schema in a single transaction so it commits (and syncs) once
+  db.transaction(() => {
+    // Create events table
+    db.exec(`
+      CREATE TABLE IF NOT EXISTS events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        source_app TEXT NOT NULL,
+        session_id TEXT NOT NULL,
+        hook_event_type TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        chat TEXT,
+        summary TEXT,
+        timestamp INTEGER NOT NULL
+      )
+    `);
     
-    // Check if summary column exists, add it if not (for migration)
-    const hasSummaryColumn = columns.some((col: any) => col.name === 'summary');
-    if (!hasSummaryColumn) {
-      db.exec('ALTER TABLE events ADD COLUMN summary TEXT');
+    // Check if chat column exists, add it if not (for migration)
+    try {
+      const columns = db.prepare("PRAGMA table_info(events)").all() as any[];
+      const hasChatColumn = columns.some((col: any) => col.name === 'chat');
+      if (!hasChatColumn) {
+        db.exec('ALTER TABLE events ADD COLUMN chat TEXT');
+      }
+    
+      // Check if summary column exists, add it if not (for migration)
+      const hasSummaryColumn = columns.some((col: any) => col.name === 'summary');
+      if (!hasSummaryColumn) {
+        db.exec('ALTER TABLE events ADD COLUMN summary TEXT');
+      }
+    } catch (error) {
+      // If the table doesn't exist yet, the CREATE TABLE above will handle it
     }
-  } catch (error) {
-    // If the table doesn't exist yet, the CREATE TABLE above will handle it
-  }
-  
-  // Create indexes for common queries
-  db.exec('CREATE INDEX IF NOT EXISTS idx_source_app ON events(source_app)');
-  db.exec('CREATE INDEX IF NOT EXISTS idx_session_id ON events(session_id)');
-  db.exec('CREATE INDEX IF NOT EXISTS idx_hook_event_type ON events(hook_event_type)');
-  db.exec('CREATE INDEX IF NOT EXISTS idx_timestamp ON events(timestamp)');
-  
-  // Create themes table
-  db.exec(`
-    CREATE TABLE IF NOT EXISTS themes (
-      id TEXT PRIMARY KEY,
-      name TEXT NOT NULL UNIQUE,
-      displayName TEXT NOT NULL,
-      description TEXT,
-      colors TEXT NOT NULL,
-      isPublic INTEGER NOT NULL DEFAULT 0,
-      authorId TEXT,
-      authorName TEXT,
-      createdAt INTEGER NOT NULL,
-      updatedAt INTEGER NOT NULL,
-      tags TEXT,
-      downloadCount INTEGER DEFAULT 0,
-      rating REAL DEFAULT 0,
-      ratingCount INTEGER DEFAULT 0
-    )
-  `);
-  
-  // Create theme shares table
-  db.exec(`
-    CREATE TABLE IF NOT EXISTS theme_shares (
-      id TEXT PRIMARY KEY,
-      themeId TEXT NOT NULL,
-      shareToken TEXT NOT NULL UNIQUE,
-      expiresAt INTEGER,
-      isPublic INTEGER NOT NULL DEFAULT 0,
-      allowedUsers TEXT,
-      createdAt INTEGER NOT NULL,
-      accessCount INTEGER DEFAULT 0,
-      FOREIGN KEY (themeId) REFERENCES themes (id) ON DELETE CASCADE
-    )
-  `);
-  
-  // Create theme ratings table
-  db.exec(`
-    CREATE TABLE IF NOT EXISTS theme_ratings (
-      id TEXT PRIMARY KEY,
-      themeId TEXT NOT NULL,
-      userId TEXT NOT NULL,
-      rating INTEGER NOT NULL,
-      comment TEXT,
-      createdAt INTEGER NOT NULL,
-      UNIQUE(themeId, userId),
-      FOREIGN KEY (themeId) REFERENCES themes (id) ON DELETE CASCADE
-    )
-  `);
-  
-  // Create indexes for theme tables
-  db.exec('CREATE INDEX IF NOT EXISTS idx_themes_name ON themes(name)');
-  db.exec('CREATE INDEX IF NOT EXISTS idx_themes_isPublic ON themes(isPublic)');
-  db.exec('CREATE INDEX IF NOT EXISTS idx_themes_createdAt ON themes(createdAt)');
-  db.exec('CREATE INDEX IF NOT EXISTS idx_theme_shares_token ON theme_shares(shareToken)');
-  db.exec('CREATE INDEX IF NOT EXISTS idx_theme_ratings_theme ON theme_ratings(themeId)');
+    
+    // Create indexes for common queries
+    db.exec('CREATE INDEX IF NOT EXISTS idx_source_app ON events(source_app)');
+    db.exec('CREATE INDEX IF NOT EXISTS idx_session_id ON events(session_id)');
+    db.exec('CREATE INDEX IF NOT EXISTS idx_hook_event_type ON events(hook_event_type)');
+    db.exec('CREATE INDEX IF NOT EXISTS idx_timestamp ON events(timestamp)');
+    
+    // Create themes table
+    db.exec(`
+      CREATE TABLE IF NOT EXISTS themes (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE,
+        displayName TEXT NOT NULL,
+        description TEXT,
+        colors TEXT NOT NULL,
+        isPublic INTEGER NOT NULL DEFAULT 0,
+        authorId TEXT,
+        authorName TEXT,
+        createdAt INTEGER NOT NULL,
+        updatedAt INTEGER NOT NULL,
+        tags TEXT,
+        downloadCount INTEGER DEFAULT 0,
+        rating REAL DEFAULT 0,
+        ratingCount INTEGER DEFAULT 0
+      )
+    `);
+    
+    // Create theme shares table
+    db.exec(`
+      CREATE TABLE IF NOT EXISTS theme_shares (
+        id TEXT PRIMARY KEY,
+        themeId TEXT NOT NULL,
+        shareToken TEXT NOT NULL UNIQUE,
+        expiresAt INTEGER,
+        isPublic INTEGER NOT NULL DEFAULT 0,
+        allowedUsers TEXT,
+        createdAt INTEGER NOT NULL,
+        accessCount INTEGER DEFAULT 0,
+        FOREIGN KEY (themeId) REFERENCES themes (id) ON DELETE CASCADE
+      )
+    `);
+    
+    // Create theme ratings table
+    db.exec(`
+      CREATE TABLE IF NOT EXISTS theme_ratings (
+        id TEXT PRIMARY KEY,
+        themeId TEXT NOT NULL,
+        userId TEXT NOT NULL,
+        rating INTEGER NOT NULL,
+        comment TEXT,
+        createdAt INTEGER NOT NULL,
+        UNIQUE(themeId, userId),
+        FOREIGN KEY (themeId) REFERENCES themes (id) ON DELETE CASCADE
+      )
+    `);
+    
+    // Create indexes for theme tables
+    db.exec('CREATE INDEX IF NOT EXISTS idx_themes_name ON themes(name)');
+    db.exec('CREATE INDEX IF NOT EXISTS idx_themes_isPublic ON themes(isPublic)');
+    db.exec('CREATE INDEX IF NOT EXISTS idx_themes_createdAt ON themes(createdAt)');
+    db.exec('CREATE INDEX IF NOT EXISTS idx_theme_shares_token ON theme_shares(shareToken)');
+    db.exec('CREATE INDEX IF NOT EXISTS idx_theme_ratings_theme ON theme_ratings(themeId)');
+  })();
 }
 
 export function insertEvent(event: HookEvent): HookEvent {
@@ -240,6 +243,11 @@ export function getTheme(id: string): Theme | null {
   };
 }
 
+export function themeNameExists(name: string): boolean {
+  const stmt = db.prepare('SELECT 1 FROM themes WHERE name = ? LIMIT 1');
+  return Boolean(stmt.get(name));
+}
+
 export function getThemes(query: ThemeSearchQuery = {}): Theme[] {
   let sql = 'SELECT * FROM themes WHERE 1=1';
   const params: any[] = [];
@@ -305,6 +313,18 @@ export function getThemes(query: ThemeSearchQuery = {}): Theme[] {
   }));
 }
 
+export function getThemeAggregates(): { totalThemes: number; publicThemes: number; totalDownloads: number; averageRating: number } {
+  const stmt = db.prepare(`
+    SELECT
+      COUNT(*) AS totalThemes,
+      COALESCE(SUM(isPublic), 0) AS publicThemes,
+      COALESCE(SUM(downloadCount), 0) AS totalDownloads,
+      COALESCE(AVG(COALESCE(rating, 0)), 0) AS averageRating
+    FROM themes
+  `);
+  return stmt.get() as any;
+}
+
 export function deleteTheme(id: string): boolean {
   const stmt = db.prepare('DELETE FROM themes WHERE id = ?');
   const result = stmt.run(id);
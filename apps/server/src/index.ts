@@ -16,8 +16,12 @@ import { config, validateRequiredConfig } from './config';
 validateRequiredConfig();
 initDatabase();
 
-// Store WebSocket clients
-const wsClients = new Set<any>();
+// Pub/sub topic all WebSocket clients subscribe to for live events
+const EVENTS_TOPIC = 'events';
+
+// Resolve allowed CORS origins once at startup instead of per request
+const allowedOrigins = new Set(Array.isArray(config.CORS_ORIGINS) ? config.CORS_ORIGINS : [config.CORS_ORIGINS]);
+const allowAnyOrigin = allowedOrigins.has('*');
 
 // Create Bun server with HTTP and WebSocket support
 const server = Bun.serve({
@@ -27,9 +31,8 @@ const server = Bun.serve({
     const url = new URL(req.url);
     
     // Handle CORS
-    const allowedOrigins = Array.isArray(config.CORS_ORIGINS) ? config.CORS_ORIGINS : [config.CORS_ORIGINS];
     const requestOrigin = req.headers.get('origin');
-    const corsOrigin = allowedOrigins.includes('*') || allowedOrigins.includes(requestOrigin || '') ? (requestOrigin || '*') : 'null';
+    const corsOrigin = allowAnyOrigin || allowedOrigins.has(requestOrigin || '') ? (requestOrigin || '*') : 'null';
     
     const headers = {
       'Access-Control-Allow-Origin': corsOrigin,
@@ -58,16 +61,8 @@ const server = Bun.serve({
         // Insert event into database
         const savedEvent = insertEvent(event);
         
-        // Broadcast to all WebSocket clients
-        const message = JSON.stringify({ type: 'event', data: savedEvent });
-        wsClients.forEach(client => {
-          try {
-            client.send(message);
-          } catch (err) {
-            // Client disconnected, remove from set
-            wsClients.delete(client);
-          }
-        });
+        // Broadcast to all WebSocket clients (fan-out happens natively in Bun)
+        server.publish(EVENTS_TOPIC, JSON.stringify({ type: 'event', data: savedEvent }));
         
         return new Response(JSON.stringify(savedEvent), {
           headers: { ...headers, 'Content-Type': 'application/json' }
@@ -301,7 +296,7 @@ const server = Bun.serve({
   websocket: {
     open(ws) {
       console.log('WebSocket client connected');
-      wsClients.add(ws);
+      ws.subscribe(EVENTS_TOPIC);
       
       // Send recent events on connection
       const events = getRecentEvents(50);
@@ -314,8 +309,8 @@ const server = Bun.serve({
     },
     
     close(ws) {
+      // Bun unsubscribes closed sockets from all topics automatically
       console.log('WebSocket client disconnected');
-      wsClients.delete(ws);
     }
   }
 });
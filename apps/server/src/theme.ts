@@ -3,6 +3,8 @@ import {
   updateTheme, 
   getTheme, 
   getThemes, 
+  themeNameExists,
+  getThemeAggregates,
   deleteTheme, 
   incrementThemeDownloadCount 
 } from './db';
@@ -139,8 +141,7 @@ export async function createTheme(themeData: any): Promise<ApiResponse<Theme>> {
     }
     
     // Check if theme name already exists
-    const existingThemes = getThemes({ query: sanitized.name });
-    if (existingThemes.some(t => t.name === sanitized.name)) {
+    if (themeNameExists(sanitized.name!)) {
       return {
         success: false,
         error: 'Theme name already exists',
@@ -403,17 +404,14 @@ export async function importTheme(importData: any, authorId?: string): Promise<A
 // Utility function to get theme statistics
 export async function getThemeStats(): Promise<ApiResponse<any>> {
   try {
-    const allThemes = getThemes();
-    const publicThemes = getThemes({ isPublic: true });
+    const { totalThemes, publicThemes, totalDownloads, averageRating } = getThemeAggregates();
     
     const stats = {
-      totalThemes: allThemes.length,
-      publicThemes: publicThemes.length,
-      privateThemes: allThemes.length - publicThemes.length,
-      totalDownloads: allThemes.reduce((sum, theme) => sum + (theme.downloadCount || 0), 0),
-      averageRating: allThemes.length > 0 
-        ? allThemes.reduce((sum, theme) => sum + (theme.rating || 0), 0) / allThemes.length 
-        : 0
+      totalThemes,
+      publicThemes,
+      privateThemes: totalThemes - publicThemes,
+      totalDownloads,
+      averageRating
     };
     
     return {
@@ -91,12 +91,12 @@ class HookEventHandler(FileSystemEventHandler):
             process = subprocess.Popen(
                 cmd,
                 stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
                 text=True
             )
             
-            stdout, stderr = process.communicate(input=json.dumps(event_data['payload']))
+            _, stderr = process.communicate(input=json.dumps(event_data['payload']))
             
             if process.returncode == 0:
                 print(f"✅ Event forwarded: {event_data['hook_event_type']}")
@@ -44,45 +44,56 @@ def activate_venv():
     print(f"📦 Using virtual environment: {venv_path}")
     return str(python_exe), str(activate_script)
 
+def _normalize_package_name(name):
+    """Normalize a distribution name the way pip compares them."""
+    return name.lower().replace("_", "-").replace(".", "-")
+
+def find_missing_packages(python_exe, packages):
+    """Return the packages not installed in the venv, using a single pip call."""
+    result = subprocess.run([python_exe, "-m", "pip", "show", *packages],
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    installed = {
+        _normalize_package_name(line.split(":", 1)[1].strip())
+        for line in result.stdout.splitlines()
+        if line.startswith("Name:")
+    }
+    return [pkg for pkg in packages if _normalize_package_name(pkg) not in installed]
+
 def install_dependencies():
     """Install required dependencies."""
-    project_root = get_project_root()
     python_exe, _ = activate_venv()
     
-    # Install tmux-orchestrator if not available
-    try:
-        result = subprocess.run([python_exe, "-m", "pip", "show", "tmux-orchestrator"], 
-                              capture_output=True, text=True)
-        if result.returncode != 0:
-            print("🔧 Installing tmux-orchestrator...")
-            subprocess.run([python_exe, "-m", "pip", "install", "tmux-orchestrator"], check=True)
-            print("✅ tmux-orchestrator installed")
-    except subprocess.CalledProcessError:
-        print("⚠️  Warning: Could not install tmux-orchestrator. Please install manually.")
-    
-    # Install other dependencies
     dependencies = [
+        "tmux-orchestrator",
         "pyyaml",
         "requests",
         "python-dotenv",
         "watchdog"
     ]
     
-    for dep in dependencies:
+    missing = find_missing_packages(python_exe, dependencies)
+    if not missing:
+        return
+    
+    # Try a single pip install for everything that's missing
+    print(f"🔧 Installing {', '.join(missing)}...")
+    result = subprocess.run([python_exe, "-m", "pip", "install", *missing])
+    if result.returncode == 0:
+        print(f"✅ {', '.join(missing)} installed")
+        return
+    
+    # Fall back to one package at a time so one failure doesn't block the rest
+    for dep in missing:
         try:
-            result = subprocess.run([python_exe, "-m", "pip", "show", dep], 
-                                  capture_output=True, text=True)
-            if result.returncode != 0:
-                print(f"🔧 Installing {dep}...")
-                subprocess.run([python_exe, "-m", "pip", "install", dep], check=True)
-                print(f"✅ {dep} installed")
+            subprocess.run([python_exe, "-m", "pip", "install", dep], check=True)
+            print(f"✅ {dep} installed")
         except subprocess.CalledProcessError:
-            print(f"⚠️  Warning: Could not install {dep}")
+            print(f"⚠️  Warning: Could not install {dep}. Please install manually.")
 
 def check_tmux():
     """Check if tmux is available."""
     try:
-        subprocess.run(["tmux", "-V"], capture_output=True, check=True)
+        subprocess.run(["tmux", "-V"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
@@ -347,7 +358,7 @@ def launch_tmux_session():
     try:
         # Kill existing session if it exists
         subprocess.run(["tmux", "kill-session", "-t", "claude-dev-env"], 
-                      capture_output=True)
+                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         
         # Launch new session with orchestrator
         print("🚀 Launching tmux session with orchestrator...")
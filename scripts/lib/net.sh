@@ -0,0 +1,32 @@
+#!/bin/bash
+
+# Shared port/readiness helpers, sourced by start-system.sh and test-system.sh
+
+# Function to check if port is in use
+check_port() {
+    local port=$1
+    if lsof -Pi :$port -sTCP:LISTEN -t >/dev/null 2>&1; then
+        return 0  # Port is in use
+    else
+        return 1  # Port is free
+    fi
+}
+
+# Function to wait for any of the given URLs to respond, polling with
+# exponential backoff (0.1s doubling up to 1s) until the timeout in seconds
+wait_for_url() {
+    local timeout=$1
+    shift
+    local delay=0.1
+    local deadline=$((SECONDS + timeout))
+    while [ $SECONDS -lt $deadline ]; do
+        for url in "$@"; do
+            if curl -s "$url" >/dev/null 2>&1; then
+                return 0
+            fi
+        done
+        sleep $delay
+        delay=$(awk -v d="$delay" 'BEGIN { d *= 2; print (d > 1 ? 1 : d) }')
+    done
+    return 1
+}
@@ -19,15 +19,8 @@ YELLOW='\033[0;33m'
 BLUE='\033[0;34m'
 NC='\033[0m' # No Color
 
-# Function to check if port is in use
-check_port() {
-    local port=$1
-    if lsof -Pi :$port -sTCP:LISTEN -t >/dev/null 2>&1; then
-        return 0  # Port is in use
-    else
-        return 1  # Port is free
-    fi
-}
+# Load shared port/readiness helpers
+source "$SCRIPT_DIR/lib/net.sh"
 
 # Check if ports are already in use
 if check_port 4000; then
@@ -48,13 +41,9 @@ SERVER_PID=$!
 
 # Wait for server to be ready
 echo -e "${YELLOW}Waiting for server to start...${NC}"
-for i in {1..10}; do
-    if curl -s http://localhost:4000/health >/dev/null 2>&1 || curl -s http://localhost:4000/events/filter-options >/dev/null 2>&1; then
-        echo -e "${GREEN}✅ Server is ready!${NC}"
-        break
-    fi
-    sleep 1
-done
+if wait_for_url 10 http://localhost:4000/health http://localhost:4000/events/filter-options; then
+    echo -e "${GREEN}✅ Server is ready!${NC}"
+fi
 
 # Start client
 echo -e "\n${GREEN}Starting client on port 5173...${NC}"
@@ -64,13 +53,9 @@ CLIENT_PID=$!
 
 # Wait for client to be ready
 echo -e "${YELLOW}Waiting for client to start...${NC}"
-for i in {1..10}; do
-    if curl -s http://localhost:5173 >/dev/null 2>&1; then
-        echo -e "${GREEN}✅ Client is ready!${NC}"
-        break
-    fi
-    sleep 1
-done
+if wait_for_url 10 http://localhost:5173; then
+    echo -e "${GREEN}✅ Client is ready!${NC}"
+fi
 
 # Display status
 echo -e "\n${BLUE}============================================${NC}"
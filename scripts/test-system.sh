@@ -13,18 +13,27 @@ SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"
 # Get the project root directory (parent of scripts)
 PROJECT_ROOT="$( cd "$SCRIPT_DIR/.." && pwd )"
 
+# Load shared port/readiness helpers
+source "$SCRIPT_DIR/lib/net.sh"
+
+# Make sure nothing else is already answering on the server port
+if check_port 4000; then
+    echo -e "${RED}❌ Port 4000 is already in use. Run ./scripts/reset-system.sh first.${NC}"
+    exit 1
+fi
+
 # Step 1: Start the server in background
 echo -e "\n${GREEN}Step 1: Starting server...${NC}"
 cd "$PROJECT_ROOT/apps/server"
 bun run start &
 SERVER_PID=$!
-sleep 3
 
-# Check if server is running
-if ps -p $SERVER_PID > /dev/null; then
+# Check if server is running and ready
+if wait_for_url 10 http://localhost:4000/events/filter-options && ps -p $SERVER_PID > /dev/null; then
     echo "✅ Server started successfully (PID: $SERVER_PID)"
 else
     echo -e "${RED}❌ Server failed to start${NC}"
+    kill $SERVER_PID 2>/dev/null
     exit 1
 fi
 